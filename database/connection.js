@@ -14,5 +14,6 @@ if ( !host || !username || !password  || !dbName ) {
 
 const { Sequelize } = require('sequelize');
 const connectionString = `mariadb://${username}:${password}@${host}:3306/${dbName}`;
-const sequelize = new Sequelize(connectionString);
+// Don't echo every SQL statement to the console; it's synchronous I/O per query.
+const sequelize = new Sequelize(connectionString, { logging: false });
 module.exports = sequelize;
\ No newline at end of file
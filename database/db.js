@@ -6,12 +6,6 @@ const sequelize = require('./connection');
 
 
 
-sequelize.authenticate().then(res => {
-    console.log('Connection has been established successfully.');
-}).catch(err => {
-    console.log(`${err.message}`)
-})
-
 const Users = sequelize.define('users', {
     // Model attributes are defined here
     first_name: {
@@ -37,8 +31,13 @@ const Users = sequelize.define('users', {
     underscored: true
 });
 
-sequelize.sync({ force: true }).then(() => {
-    console.log("Drop and re-sync db.");
+// Only create missing tables; existing ones are left as-is.
+// sync() needs a working connection, so it doubles as the connection check.
+sequelize.sync().then(() => {
+    console.log('Connection has been established successfully.');
+    console.log("Synced db.");
+}).catch(err => {
+    console.log(`${err.message}`)
 });
 
 module.exports = { Users }
\ No newline at end of file
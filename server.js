@@ -31,11 +31,9 @@ app.post('/users', body('email').isEmail(), async (req, res) => {
     
     try {
         const jane = await Users.create(req.body);
-        res.status(201);
-        res.send(jane);
+        res.status(201).json(jane);
     } catch (err) {
-        res.status(500);
-        res.send({'error': 'Error with request shape.'})
+        res.status(500).json({'error': 'Error with request shape.'});
     }
 });
 